@@ -0,0 +1,125 @@
+import pandas as pd
+import numpy as np
+
+# Leaderboard metric label -> (column, higher is better)
+LEADERBOARD_METRICS = {
+    'ROAS': ('roas', True),
+    'CAC': ('cac', False),
+    'Spend': ('spend', True),
+    'Revenue': ('attributed revenue', True),
+    'CTR': ('ctr', True),
+}
+
+SUM_COLUMNS = ['impressions', 'clicks', 'spend', 'attributed revenue', 'attributed new customers']
+
+CAMPAIGN_KEY = ['campaign', 'channel', 'tactic', 'state']
+
+def create_campaign_daily(marketing_df, business_df):
+    """
+    Aggregate marketing data to one row per campaign per day, attributing
+    each day's new customers to campaigns by their share of that day's
+    attributed revenue
+    """
+    print("Creating campaign daily aggregates...")
+
+    campaign_daily = marketing_df.groupby(['date'] + CAMPAIGN_KEY).agg({
+        'impressions': 'sum',
+        'clicks': 'sum',
+        'spend': 'sum',
+        'attributed revenue': 'sum'
+    }).reset_index()
+
+    daily_revenue = campaign_daily.groupby('date')['attributed revenue'].transform('sum')
+    new_customers = campaign_daily['date'].map(business_df.set_index('date')['new customers']).fillna(0)
+    campaign_daily['attributed new customers'] = np.where(
+        daily_revenue > 0,
+        new_customers * campaign_daily['attributed revenue'] / daily_revenue,
+        0
+    )
+
+    return campaign_daily
+
+def prepare_leaderboard_data(campaign_daily):
+    """
+    Encode campaign daily aggregates as read-only NumPy arrays for fast range
+    queries. Campaigns are keyed on name, channel, tactic and state together.
+    """
+    campaign_codes, campaigns = pd.MultiIndex.from_frame(campaign_daily[CAMPAIGN_KEY]).factorize()
+
+    data = {
+        'dates': campaign_daily['date'].values.astype('datetime64[D]'),
+        'campaign_codes': campaign_codes,
+    }
+    for level, col in enumerate(CAMPAIGN_KEY):
+        data[f'key_{col}'] = np.asarray(campaigns.get_level_values(level), dtype=object)
+    for col in ['channel', 'tactic', 'state']:
+        codes, values = pd.factorize(campaign_daily[col])
+        data[f'{col}_codes'], data[f'{col}_values'] = codes, np.asarray(values, dtype=object)
+    for col in SUM_COLUMNS:
+        data[col] = campaign_daily[col].to_numpy(dtype=float)
+
+    # Shared across sessions when cached as a resource, so guard against mutation
+    for array in data.values():
+        array.setflags(write=False)
+    return data
+
+def campaign_leaderboard(data, metric='ROAS', k=10, start_date=None, end_date=None,
+                         channels=None, tactics=None, states=None, min_spend=0, best=True):
+    """
+    Return the K best (or worst) campaigns by a metric over a date range and filter set.
+
+    Ratio metrics are computed from the summed inputs over the range. Campaigns
+    spending less than min_spend are excluded. Only the K selected rows are
+    sorted; the rest are partitioned away with np.argpartition.
+    """
+    column, higher_is_better = LEADERBOARD_METRICS[metric]
+
+    # Row filter
+    mask = np.ones(len(data['dates']), dtype=bool)
+    if start_date is not None:
+        mask &= data['dates'] >= np.datetime64(start_date, 'D')
+    if end_date is not None:
+        mask &= data['dates'] <= np.datetime64(end_date, 'D')
+    for col, selected in [('channel', channels), ('tactic', tactics), ('state', states)]:
+        if selected is not None:
+            # Filter on integer codes rather than comparing strings per row
+            allowed = np.isin(data[f'{col}_values'], list(selected))
+            if not allowed.all():
+                mask &= allowed[data[f'{col}_codes']]
+
+    # Per-campaign totals over the selected rows
+    codes = data['campaign_codes'][mask]
+    n_campaigns = len(data['key_campaign'])
+    totals = {col: np.bincount(codes, weights=data[col][mask], minlength=n_campaigns)
+              for col in SUM_COLUMNS}
+
+    spend = totals['spend']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        totals['roas'] = np.where(spend > 0, totals['attributed revenue'] / spend, 0)
+        totals['ctr'] = np.where(totals['impressions'] > 0, totals['clicks'] / totals['impressions'], 0)
+        totals['cpc'] = np.where(totals['clicks'] > 0, spend / totals['clicks'], 0)
+        totals['cac'] = np.where(totals['attributed new customers'] > 0,
+                                 spend / totals['attributed new customers'], np.nan)
+
+    # Eligible campaigns; those without a value for the metric (CAC with no
+    # attributed customers) cannot be ranked
+    candidates = np.flatnonzero((spend > 0) & (spend >= min_spend) & np.isfinite(totals[column]))
+    if candidates.size == 0:
+        return pd.DataFrame(columns=CAMPAIGN_KEY + SUM_COLUMNS + ['roas', 'ctr', 'cpc', 'cac'])
+
+    # Sort key where smaller is ranked first
+    values = totals[column][candidates]
+    key = -values if higher_is_better == best else values
+
+    k = min(k, candidates.size)
+    if k < candidates.size:
+        selected = np.argpartition(key, k - 1)[:k]
+    else:
+        selected = np.arange(candidates.size)
+    selected = selected[np.argsort(key[selected], kind='stable')]
+    top = candidates[selected]
+
+    leaderboard = pd.DataFrame({col: data[f'key_{col}'][top] for col in CAMPAIGN_KEY})
+    for col in SUM_COLUMNS + ['roas', 'ctr', 'cpc', 'cac']:
+        leaderboard[col] = totals[col][top]
+    return leaderboard
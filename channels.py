@@ -0,0 +1,2 @@
+# Marketing channels present in the source data, in display order
+CHANNELS = ['Facebook', 'Google', 'TikTok']
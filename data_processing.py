@@ -2,6 +2,9 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 import warnings
+from report_snapshots import create_report_snapshots, save_report_snapshots
+from campaign_leaderboard import create_campaign_daily
+from channels import CHANNELS
 warnings.filterwarnings('ignore')
 
 def load_and_process_data():
@@ -96,10 +99,9 @@ def create_combined_dataset(business_df, marketing_df):
     }).reset_index()
     
     # Create separate columns for each channel
-    channels = ['Facebook', 'Google', 'TikTok']
     marketing_data = {}
     
-    for channel in channels:
+    for channel in CHANNELS:
         channel_data = daily_marketing[daily_marketing['channel'] == channel].set_index('date')
         for col in ['impressions', 'clicks', 'spend', 'attributed revenue', 'ctr', 'cpc', 'cpm', 'roas']:
             if col in channel_data.columns:
@@ -112,7 +114,7 @@ def create_combined_dataset(business_df, marketing_df):
     combined_df = business_df.set_index('date').join(marketing_pivot, how='outer').fillna(0)
     
     # Calculate CAC (Customer Acquisition Cost) for each channel
-    for channel in channels:
+    for channel in CHANNELS:
         spend_col = f'spend_{channel}'
         new_customers_col = 'new customers'
         if spend_col in combined_df.columns:
@@ -123,8 +125,8 @@ def create_combined_dataset(business_df, marketing_df):
             )
     
     # Calculate total marketing metrics
-    spend_cols = [f'spend_{channel}' for channel in channels if f'spend_{channel}' in combined_df.columns]
-    revenue_cols = [f'attributed revenue_{channel}' for channel in channels if f'attributed revenue_{channel}' in combined_df.columns]
+    spend_cols = [f'spend_{channel}' for channel in CHANNELS if f'spend_{channel}' in combined_df.columns]
+    revenue_cols = [f'attributed revenue_{channel}' for channel in CHANNELS if f'attributed revenue_{channel}' in combined_df.columns]
     
     combined_df['total_spend'] = combined_df[spend_cols].sum(axis=1)
     combined_df['total_attributed_revenue'] = combined_df[revenue_cols].sum(axis=1)
@@ -163,14 +165,30 @@ def process_all_data():
     
     return business_df, marketing_df, combined_df, daily_marketing
 
-if __name__ == "__main__":
-    # Process data when script is run directly
-    business_df, marketing_df, combined_df, daily_marketing = process_all_data()
-    
-    # Save processed data
+def save_processed_data(business_df, marketing_df, combined_df, daily_marketing):
+    """
+    Save processed data and report snapshots to the working directory
+    """
     business_df.to_csv('processed_business.csv', index=False)
     marketing_df.to_csv('processed_marketing.csv', index=False)
     combined_df.to_csv('processed_combined.csv')
     daily_marketing.to_csv('processed_daily_marketing.csv', index=False)
     
+    # Per-day campaign aggregates for the campaign leaderboards
+    campaign_daily = create_campaign_daily(marketing_df, business_df)
+    campaign_daily.to_csv('processed_campaign_daily.csv', index=False)
+    
     print("Processed data saved to CSV files")
+    
+    # Precompute standard report ranges for the dashboard
+    snapshots = create_report_snapshots(combined_df, daily_marketing)
+    save_report_snapshots(snapshots)
+    
+    print("Report snapshots saved to report_snapshots.json")
+
+if __name__ == "__main__":
+    # Process data when script is run directly
+    business_df, marketing_df, combined_df, daily_marketing = process_all_data()
+    
+    # Save processed data
+    save_processed_data(business_df, marketing_df, combined_df, daily_marketing)
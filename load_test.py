@@ -0,0 +1,421 @@
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from datetime import timedelta
+import pandas as pd
+import numpy as np
+import psutil
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from data_processing import process_all_data, save_processed_data
+import warnings
+warnings.filterwarnings('ignore')
+
+DASHBOARD_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'marketing_dashboard.py')
+WIDGET_TYPES = {'selectbox', 'multiselect', 'radio', 'number_input', 'date_input'}
+PAGES = ["Executive Overview", "Channel Performance", "Customer Acquisition", "Campaign Analysis", "Scenario Planner"]
+
+# Tactics, states and daily volume profile (mean impressions, CTR, CPC, ROAS) per channel
+CHANNEL_PROFILES = {
+    'Facebook': (['ASC', 'Prospecting', 'Retargeting'], ['NY', 'CA'], 180000, 0.014, 0.75, 2.6),
+    'Google': (['Non-Branded Search', 'Display'], ['NY', 'CA'], 210000, 0.042, 0.16, 3.1),
+    'TikTok': (['Retargeting', 'Spark Ads'], ['CA'], 150000, 0.015, 0.54, 2.8),
+}
+
+def generate_synthetic_data(out_dir, n_days, campaigns_per_channel, seed=0):
+    """
+    Write raw business and channel CSVs with the same schema as the real inputs
+    """
+    print(f"Generating synthetic data: {n_days} days, {campaigns_per_channel} campaigns per channel...")
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range('2025-01-01', periods=n_days, freq='D')
+
+    for channel, (tactics, states, impressions, ctr, cpc, roas) in CHANNEL_PROFILES.items():
+        campaign_tactics = rng.choice(tactics, campaigns_per_channel)
+        campaign_states = rng.choice(states, campaigns_per_channel)
+        campaigns = [f'{channel} - {tactic} - C{i + 1:02d}' for i, tactic in enumerate(campaign_tactics)]
+
+        n_rows = n_days * campaigns_per_channel
+        impression_values = rng.gamma(8, impressions / 8, n_rows).round()
+        clicks = (impression_values * ctr * rng.lognormal(0, 0.2, n_rows)).round()
+        spend = (clicks * cpc * rng.lognormal(0, 0.2, n_rows)).round(2)
+        revenue = (spend * roas * rng.lognormal(0, 0.3, n_rows)).round(2)
+
+        pd.DataFrame({
+            'date': np.repeat(dates.strftime('%Y-%m-%d'), campaigns_per_channel),
+            'tactic': np.tile(campaign_tactics, n_days),
+            'state': np.tile(campaign_states, n_days),
+            'campaign': np.tile(campaigns, n_days),
+            'impression': impression_values.astype(int),
+            'clicks': clicks.astype(int),
+            'spend': spend,
+            'attributed revenue': revenue,
+        }).to_csv(os.path.join(out_dir, f'{channel}.csv'), index=False)
+
+    orders = rng.normal(2900, 600, n_days).clip(100).round()
+    new_orders = (orders * rng.uniform(0.35, 0.5, n_days)).round()
+    revenue = (orders * rng.normal(90, 10, n_days)).round(2)
+    cogs = (revenue * rng.uniform(0.4, 0.5, n_days)).round(2)
+    pd.DataFrame({
+        'date': dates.strftime('%Y-%m-%d'),
+        '# of orders': orders.astype(int),
+        '# of new orders': new_orders.astype(int),
+        'new customers': (new_orders * rng.uniform(0.95, 1.0, n_days)).round().astype(int),
+        'total revenue': revenue,
+        'gross profit': (revenue - cogs).round(2),
+        'COGS': cogs,
+    }).to_csv(os.path.join(out_dir, 'business.csv'), index=False)
+
+def prepare_dataset(out_dir, n_days, campaigns_per_channel, seed=0):
+    """
+    Generate synthetic inputs and run the processing pipeline on them in out_dir
+    """
+    generate_synthetic_data(out_dir, n_days, campaigns_per_channel, seed)
+
+    cwd = os.getcwd()
+    os.chdir(out_dir)
+    try:
+        save_processed_data(*process_all_data())
+    finally:
+        os.chdir(cwd)
+
+class MemorySampler(threading.Thread):
+    """Background thread recording the RSS of the dashboard server process"""
+
+    def __init__(self, pid, interval):
+        super().__init__(daemon=True)
+        self.process = psutil.Process(pid)
+        self.interval = interval
+        self.samples = []
+        self._stop_event = threading.Event()
+        self._start_time = time.perf_counter()
+
+    def rss_mb(self):
+        try:
+            return self.process.memory_info().rss / (1024 * 1024)
+        except psutil.NoSuchProcess:
+            return 0.0
+
+    def run(self):
+        while not self._stop_event.is_set():
+            self.samples.append((time.perf_counter() - self._start_time, self.rss_mb()))
+            self._stop_event.wait(self.interval)
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+def free_port():
+    """Ask the OS for an unused local TCP port"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def start_server(data_dir, port, timeout):
+    """
+    Launch one headless Streamlit server for the dashboard in data_dir and
+    wait until its health endpoint responds
+    """
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'streamlit', 'run', DASHBOARD_SCRIPT,
+         '--server.headless', 'true',
+         '--server.port', str(port),
+         '--server.address', '127.0.0.1',
+         '--server.fileWatcherType', 'none',
+         '--browser.gatherUsageStats', 'false'],
+        cwd=data_dir, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"Streamlit server exited with code {server.returncode}")
+        try:
+            with urllib.request.urlopen(f'http://127.0.0.1:{port}/_stcore/health', timeout=1) as response:
+                if response.status == 200:
+                    return server
+        except OSError:
+            pass
+        time.sleep(0.2)
+
+    stop_server(server)
+    raise RuntimeError("Timed out waiting for the Streamlit server to start")
+
+def stop_server(server):
+    """Terminate the server process"""
+    server.terminate()
+    try:
+        server.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        server.kill()
+
+class DashboardSession:
+    """
+    One simulated browser tab speaking Streamlit's websocket protocol: send a
+    rerun with the current widget states, then read forward messages until
+    the script finishes
+    """
+
+    def __init__(self, url, timeout):
+        self.url = url
+        self.timeout = timeout
+        self.websocket = None
+        self.widgets = {}
+        self.widget_states = {}
+
+    async def connect(self):
+        self.websocket = await websockets.connect(self.url, subprotocols=['streamlit'], max_size=None)
+
+    async def close(self):
+        if self.websocket is not None:
+            await self.websocket.close()
+
+    def widget(self, key=None, label=None):
+        """Find a rendered widget by its user key, or by label for unkeyed widgets"""
+        for widget_id, (kind, proto) in self.widgets.items():
+            if key is not None and widget_id.endswith(f'-{key}'):
+                return proto
+            if label is not None and proto.label == label:
+                return proto
+        raise KeyError(key or label)
+
+    def widgets_of_kind(self, kind):
+        return [proto for widget_kind, proto in self.widgets.values() if widget_kind == kind]
+
+    def set_value(self, proto, field, value):
+        """Record a widget value to send with the next rerun"""
+        state = WidgetState(id=proto.id)
+        if field == 'string_array_value':
+            state.string_array_value.data.extend(value)
+        else:
+            setattr(state, field, value)
+        self.widget_states[proto.id] = state
+
+    async def rerun(self):
+        """Rerun the app with the current widget states and return the latency in seconds"""
+        msg = BackMsg()
+        msg.rerun_script.widget_states.widgets.extend(self.widget_states.values())
+
+        start = time.perf_counter()
+        await self.websocket.send(msg.SerializeToString())
+        widgets = {}
+        while True:
+            forward_msg = ForwardMsg()
+            forward_msg.ParseFromString(await asyncio.wait_for(self.websocket.recv(), self.timeout))
+            msg_type = forward_msg.WhichOneof('type')
+
+            if msg_type == 'delta' and forward_msg.delta.WhichOneof('type') == 'new_element':
+                element = forward_msg.delta.new_element
+                element_type = element.WhichOneof('type')
+                if element_type == 'exception':
+                    raise RuntimeError(element.exception.message)
+                if element_type in WIDGET_TYPES:
+                    proto = getattr(element, element_type)
+                    widgets[proto.id] = (element_type, proto)
+            elif msg_type == 'script_finished':
+                elapsed = time.perf_counter() - start
+                break
+
+        # Only widgets rendered by this run keep their state, as in the browser
+        self.widgets = widgets
+        self.widget_states = {widget_id: state for widget_id, state in self.widget_states.items()
+                              if widget_id in widgets}
+        return elapsed
+
+def random_date_range(rng, first_date, last_date):
+    """Pick a random (start, end) range inside the data"""
+    n_days = (last_date - first_date).days
+    start_offset = rng.randint(0, n_days)
+    end_offset = rng.randint(start_offset, n_days)
+    return first_date + timedelta(days=start_offset), first_date + timedelta(days=end_offset)
+
+def random_subset(rng, options):
+    """Pick a random non-empty subset of multiselect options"""
+    return rng.sample(list(options), rng.randint(1, len(options)))
+
+def set_date_range(session, rng, key, first_date, last_date):
+    date_range = random_date_range(rng, first_date, last_date)
+    session.set_value(session.widget(key=key), 'string_array_value', [d.isoformat() for d in date_range])
+
+async def randomize_report_range(session, rng, key, first_date, last_date):
+    """
+    Pick a standard range or a random custom range on a snapshot page,
+    returning any intermediate reruns as (action, latency)
+    """
+    range_select = session.widget(key=f"{key}_range_name")
+    range_name = rng.choice(range_select.options)
+    session.set_value(range_select, 'string_value', range_name)
+    if range_name != "Custom Range":
+        return []
+
+    # The custom date input only appears after a rerun, timed as its own action
+    latency = await session.rerun()
+    set_date_range(session, rng, f"{key}_date_range", first_date, last_date)
+    return [("custom range open", latency)]
+
+async def randomize_filters(session, rng, page, first_date, last_date):
+    """
+    Apply random widget values for the current page, returning any
+    intermediate reruns as (action, latency)
+    """
+    if page == "Executive Overview":
+        return await randomize_report_range(session, rng, "executive", first_date, last_date)
+    elif page == "Channel Performance":
+        return await randomize_report_range(session, rng, "channel", first_date, last_date)
+    elif page == "Customer Acquisition":
+        set_date_range(session, rng, "customer_date_range", first_date, last_date)
+    elif page == "Campaign Analysis":
+        for multiselect in session.widgets_of_kind('multiselect'):
+            session.set_value(multiselect, 'string_array_value', random_subset(rng, multiselect.options))
+        set_date_range(session, rng, "campaign_date_range", first_date, last_date)
+        metric = session.widget(key="leaderboard_metric")
+        session.set_value(metric, 'string_value', rng.choice(metric.options))
+        session.set_value(session.widget(key="leaderboard_direction"), 'string_value', rng.choice(["Top", "Bottom"]))
+        session.set_value(session.widget(key="leaderboard_k"), 'double_value', rng.randint(5, 25))
+        session.set_value(session.widget(key="leaderboard_min_spend"), 'double_value', rng.choice([0, 1000, 5000]))
+    elif page == "Scenario Planner":
+        set_date_range(session, rng, "scenario_date_range", first_date, last_date)
+        # Varying a few levers keeps the grid in the hundreds of scenarios
+        for multiselect in rng.sample(session.widgets_of_kind('multiselect'), 4):
+            session.set_value(multiselect, 'string_array_value', rng.sample(list(multiselect.options), rng.randint(2, 5)))
+    return []
+
+async def run_session(session, session_id, iterations, first_date, last_date, seed):
+    """
+    Simulate one analyst: open the app, then repeatedly switch to a random
+    page and change its filters, timing every rerun
+    """
+    rng = random.Random(seed + session_id)
+    results = [("Executive Overview", "page load", await session.rerun())]
+
+    for _ in range(iterations):
+        page = rng.choice(PAGES)
+        session.set_value(session.widget(label="Select Dashboard View"), 'string_value', page)
+        results.append((page, "page load", await session.rerun()))
+
+        for action, latency in await randomize_filters(session, rng, page, first_date, last_date):
+            results.append((page, action, latency))
+        results.append((page, "filter change", await session.rerun()))
+
+    return results
+
+async def drive_sessions(url, sessions, iterations, first_date, last_date, seed, timeout):
+    """
+    Connect every session to the server, then run them all concurrently.
+    Returns (results, wall time, client CPU seconds).
+    """
+    clients = [DashboardSession(url, timeout) for _ in range(sessions)]
+    try:
+        await asyncio.gather(*(client.connect() for client in clients))
+
+        start = time.perf_counter()
+        cpu_start = time.process_time()
+        session_results = await asyncio.gather(*(
+            run_session(client, session_id, iterations, first_date, last_date, seed)
+            for session_id, client in enumerate(clients)
+        ))
+        wall_time = time.perf_counter() - start
+        client_cpu = time.process_time() - cpu_start
+    finally:
+        await asyncio.gather(*(client.close() for client in clients))
+
+    return [result for results in session_results for result in results], wall_time, client_cpu
+
+def summarize_latencies(results):
+    """Per-page latency percentiles in milliseconds"""
+    latencies = pd.DataFrame(results, columns=['page', 'action', 'latency'])
+    latencies['latency'] = latencies['latency'] * 1000
+
+    summary = latencies.groupby(['page', 'action'])['latency'].agg(
+        runs='count',
+        mean='mean',
+        p50=lambda x: np.percentile(x, 50),
+        p90=lambda x: np.percentile(x, 90),
+        p99=lambda x: np.percentile(x, 99),
+        max='max'
+    )
+    return summary.round(1)
+
+def run_load_test(data_dir, sessions, iterations, seed=0, timeout=120, memory_interval=0.5):
+    """
+    Start one local Streamlit server on the processed data in data_dir, drive
+    it with concurrent websocket sessions and return
+    (latency summary, wall time, run count, client CPU seconds, server memory samples)
+    """
+    combined_df = pd.read_csv(os.path.join(data_dir, 'processed_combined.csv'), index_col=0, parse_dates=True)
+    first_date = combined_df.index.min().date()
+    last_date = combined_df.index.max().date()
+
+    port = free_port()
+    server = start_server(data_dir, port, timeout)
+    sampler = MemorySampler(server.pid, memory_interval)
+    sampler.start()
+    try:
+        results, wall_time, client_cpu = asyncio.run(drive_sessions(
+            f'ws://127.0.0.1:{port}/_stcore/stream', sessions, iterations,
+            first_date, last_date, seed, timeout
+        ))
+    finally:
+        sampler.stop()
+        stop_server(server)
+
+    return summarize_latencies(results), wall_time, len(results), client_cpu, sampler.samples
+
+def print_report(summary, wall_time, total_runs, client_cpu, memory_samples, sessions):
+    """Print latency, throughput and memory results"""
+    print("\nPer-page latency (ms)")
+    print(summary.to_string())
+
+    print(f"\nSessions: {sessions}")
+    print(f"Total reruns: {total_runs}")
+    print(f"Wall time: {wall_time:.1f}s")
+    print(f"Throughput: {total_runs / wall_time:.2f} reruns/s")
+    # The client shares the machine with the server; a high share here means
+    # the numbers understate what the server could do on its own
+    print(f"Client CPU: {client_cpu:.1f}s ({client_cpu / wall_time:.0%} of wall time)")
+
+    memory = np.array([rss for _, rss in memory_samples])
+    print(f"\nServer memory (RSS MB): start {memory[0]:.0f}, peak {memory.max():.0f}, end {memory[-1]:.0f}")
+    step = max(1, len(memory_samples) // 20)
+    for elapsed, rss in memory_samples[::step]:
+        print(f"  {elapsed:7.1f}s  {rss:8.1f}")
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Local concurrent load test for the marketing dashboard")
+    parser.add_argument('--sessions', type=int, default=8, help="concurrent simulated analysts")
+    parser.add_argument('--iterations', type=int, default=10, help="page visits per session")
+    parser.add_argument('--days', type=int, default=120, help="days of synthetic data")
+    parser.add_argument('--campaigns', type=int, default=10, help="synthetic campaigns per channel")
+    parser.add_argument('--data-dir', help="use existing processed data instead of generating it")
+    parser.add_argument('--seed', type=int, default=0, help="random seed for data and sessions")
+    parser.add_argument('--timeout', type=float, default=120, help="per-rerun timeout in seconds")
+    parser.add_argument('--memory-interval', type=float, default=0.5, help="memory sampling interval in seconds")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_dir = args.data_dir
+        if data_dir is None:
+            data_dir = tmp_dir
+            prepare_dataset(data_dir, args.days, args.campaigns, args.seed)
+
+        print(f"\nRunning {args.sessions} sessions x {args.iterations} page visits...")
+        summary, wall_time, total_runs, client_cpu, memory_samples = run_load_test(
+            os.path.abspath(data_dir), args.sessions, args.iterations,
+            args.seed, args.timeout, args.memory_interval
+        )
+
+    print_report(summary, wall_time, total_runs, client_cpu, memory_samples, args.sessions)
+
+if __name__ == "__main__":
+    main()
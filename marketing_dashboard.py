@@ -1,11 +1,20 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
 import warnings
+from report_snapshots import (
+    standard_date_ranges, compute_executive_kpis, build_executive_figures,
+    compute_channel_metrics, build_channel_figures,
+    load_report_snapshots, data_fingerprint, find_snapshot, figures_from_snapshot
+)
+from channels import CHANNELS
+from campaign_leaderboard import LEADERBOARD_METRICS, prepare_leaderboard_data, campaign_leaderboard
+from scenario_planner import (
+    LEVERS, LEVER_LABELS, MULTIPLIER_OPTIONS, MAX_SCENARIOS,
+    build_scenario_grid, run_scenarios, summarize_scenarios
+)
 warnings.filterwarnings('ignore')
 
 # Page configuration
@@ -84,111 +93,106 @@ def create_kpi_card(title, value, change=None, format_type="number"):
         </div>
         """, unsafe_allow_html=True)
 
-def calculate_period_comparison(data, metric, current_period, previous_period):
-    """Calculate percentage change between periods"""
-    current_value = data[data.index.isin(current_period)][metric].sum()
-    previous_value = data[data.index.isin(previous_period)][metric].sum()
-    
-    if previous_value == 0:
-        return 0
-    return ((current_value - previous_value) / previous_value) * 100
+@st.cache_resource
+def load_leaderboard_data():
+    """Load and cache campaign daily aggregates encoded for leaderboard queries"""
+    try:
+        campaign_daily = pd.read_csv('processed_campaign_daily.csv', parse_dates=['date'])
+    except FileNotFoundError:
+        return None
+    return prepare_leaderboard_data(campaign_daily)
+
+@st.cache_data
+def load_snapshots():
+    """Load and cache precomputed report snapshots"""
+    return load_report_snapshots()
+
+@st.cache_data
+def load_data_fingerprint():
+    """Fingerprint of the loaded data, used to reject stale snapshots"""
+    combined_df, daily_marketing, _, _ = load_data()
+    return data_fingerprint(combined_df, daily_marketing)
+
+def select_report_range(combined_df, key):
+    """Date range selector offering the standard snapshot ranges"""
+    standard_ranges = standard_date_ranges(combined_df)
+    range_name = st.selectbox(
+        "Select Date Range",
+        list(standard_ranges) + ["Custom Range"],
+        key=f"{key}_range_name"
+    )
+
+    if range_name != "Custom Range":
+        return standard_ranges[range_name]
+
+    date_range = st.date_input(
+        "Custom Date Range",
+        value=(combined_df.index.min().date(), combined_df.index.max().date()),
+        min_value=combined_df.index.min().date(),
+        max_value=combined_df.index.max().date(),
+        key=f"{key}_date_range"
+    )
+    if len(date_range) == 2:
+        return date_range
+    return None
 
 def create_executive_overview(combined_df):
     """Create Executive Overview dashboard"""
     st.markdown('<div class="main-header">📊 Executive Overview</div>', unsafe_allow_html=True)
     
     # Date range selector
-    date_range = st.date_input(
-        "Select Date Range",
-        value=(combined_df.index.min().date(), combined_df.index.max().date()),
-        min_value=combined_df.index.min().date(),
-        max_value=combined_df.index.max().date()
-    )
+    date_range = select_report_range(combined_df, "executive")
     
-    if len(date_range) == 2:
+    if date_range is not None:
         start_date, end_date = date_range
-        filtered_data = combined_df[(combined_df.index.date >= start_date) & (combined_df.index.date <= end_date)]
         
-        # Calculate previous period for comparison
-        period_length = (end_date - start_date).days
-        prev_start = start_date - timedelta(days=period_length)
-        prev_end = start_date - timedelta(days=1)
-        prev_data = combined_df[(combined_df.index.date >= prev_start) & (combined_df.index.date <= prev_end)]
+        # Serve precomputed values for standard ranges, compute live otherwise
+        snapshot = find_snapshot(load_snapshots(), load_data_fingerprint(), "Executive Overview", start_date, end_date)
+        if snapshot is not None:
+            kpis = snapshot['kpis']
+            figures = figures_from_snapshot(snapshot)
+        else:
+            kpis = compute_executive_kpis(combined_df, start_date, end_date)
+            figures = build_executive_figures(combined_df, start_date, end_date)
         
         # Top-level KPIs
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            total_spend = filtered_data['total_spend'].sum()
-            spend_change = calculate_period_comparison(combined_df, 'total_spend', 
-                                                     filtered_data.index.date, prev_data.index.date)
-            create_kpi_card("Total Spend", total_spend, spend_change, "currency")
+            create_kpi_card("Total Spend", kpis['total_spend'], kpis['spend_change'], "currency")
         
         with col2:
-            total_revenue = filtered_data['total revenue'].sum()
-            revenue_change = calculate_period_comparison(combined_df, 'total revenue',
-                                                       filtered_data.index.date, prev_data.index.date)
-            create_kpi_card("Total Revenue", total_revenue, revenue_change, "currency")
+            create_kpi_card("Total Revenue", kpis['total_revenue'], kpis['revenue_change'], "currency")
         
         with col3:
-            total_orders = filtered_data['# of orders'].sum()
-            orders_change = calculate_period_comparison(combined_df, '# of orders',
-                                                      filtered_data.index.date, prev_data.index.date)
-            create_kpi_card("Total Orders", total_orders, orders_change, "number")
+            create_kpi_card("Total Orders", kpis['total_orders'], kpis['orders_change'], "number")
         
         with col4:
-            avg_roas = filtered_data['total_roas'].mean()
-            create_kpi_card("Average ROAS", avg_roas, None, "decimal")
+            create_kpi_card("Average ROAS", kpis['avg_roas'], None, "decimal")
         
         # Additional KPIs
         col5, col6, col7, col8 = st.columns(4)
         
         with col5:
-            gross_profit = filtered_data['gross profit'].sum()
-            create_kpi_card("Gross Profit", gross_profit, None, "currency")
+            create_kpi_card("Gross Profit", kpis['gross_profit'], None, "currency")
         
         with col6:
-            avg_cac = filtered_data['total_cac'].mean()
-            create_kpi_card("Average CAC", avg_cac, None, "currency")
+            create_kpi_card("Average CAC", kpis['avg_cac'], None, "currency")
         
         with col7:
-            new_customers = filtered_data['new customers'].sum()
-            create_kpi_card("New Customers", new_customers, None, "number")
+            create_kpi_card("New Customers", kpis['new_customers'], None, "number")
         
         with col8:
-            avg_aov = filtered_data['aov'].mean()
-            create_kpi_card("Average AOV", avg_aov, None, "currency")
+            create_kpi_card("Average AOV", kpis['avg_aov'], None, "currency")
         
         # Charts
         st.markdown("## 📈 Key Trends")
         
         # Daily Spend vs Revenue
-        fig1 = make_subplots(specs=[[{"secondary_y": True}]])
-        
-        fig1.add_trace(
-            go.Scatter(x=filtered_data.index, y=filtered_data['total_spend'], 
-                      name="Daily Spend", line=dict(color='#ff7f0e')),
-            secondary_y=False,
-        )
-        
-        fig1.add_trace(
-            go.Scatter(x=filtered_data.index, y=filtered_data['total revenue'], 
-                      name="Daily Revenue", line=dict(color='#2ca02c')),
-            secondary_y=True,
-        )
-        
-        fig1.update_xaxes(title_text="Date")
-        fig1.update_yaxes(title_text="Daily Spend ($)", secondary_y=False)
-        fig1.update_yaxes(title_text="Daily Revenue ($)", secondary_y=True)
-        fig1.update_layout(title_text="Daily Spend vs Daily Revenue", height=400)
-        
-        st.plotly_chart(fig1, use_container_width=True)
+        st.plotly_chart(figures['spend_vs_revenue'], use_container_width=True)
         
         # ROAS Trend
-        fig2 = px.line(filtered_data.reset_index(), x='date', y='total_roas',
-                      title="ROAS Trend Over Time", height=400)
-        fig2.update_layout(yaxis_title="ROAS")
-        st.plotly_chart(fig2, use_container_width=True)
+        st.plotly_chart(figures['roas_trend'], use_container_width=True)
         
         # Additional Key Metrics
         st.markdown("## 📊 Marketing Efficiency Metrics")
@@ -196,79 +200,46 @@ def create_executive_overview(combined_df):
         col9, col10, col11, col12 = st.columns(4)
         
         with col9:
-            total_impressions = filtered_data[['impressions_Facebook', 'impressions_Google', 'impressions_TikTok']].sum().sum()
-            create_kpi_card("Total Impressions", total_impressions, None, "number")
+            create_kpi_card("Total Impressions", kpis['total_impressions'], None, "number")
         
         with col10:
-            total_clicks = filtered_data[['clicks_Facebook', 'clicks_Google', 'clicks_TikTok']].sum().sum()
-            create_kpi_card("Total Clicks", total_clicks, None, "number")
+            create_kpi_card("Total Clicks", kpis['total_clicks'], None, "number")
         
         with col11:
-            overall_ctr = (total_clicks / total_impressions) if total_impressions > 0 else 0
-            create_kpi_card("Overall CTR", overall_ctr, None, "percentage")
+            create_kpi_card("Overall CTR", kpis['overall_ctr'], None, "percentage")
         
         with col12:
-            overall_cpc = (total_spend / total_clicks) if total_clicks > 0 else 0
-            create_kpi_card("Overall CPC", overall_cpc, None, "decimal")
+            create_kpi_card("Overall CPC", kpis['overall_cpc'], None, "decimal")
         
         # Marketing Efficiency Charts
         col13, col14 = st.columns(2)
         
         with col13:
-            # Impressions vs Clicks
-            # Calculate total clicks from individual channel columns
-            filtered_data_copy = filtered_data.copy()
-            filtered_data_copy['total_clicks'] = filtered_data_copy[['clicks_Facebook', 'clicks_Google', 'clicks_TikTok']].sum(axis=1)
-            
-            fig3 = px.scatter(filtered_data_copy.reset_index(), x='total_spend', y='total_clicks',
-                            color='total_roas', size='total revenue',
-                            title="Spend vs Clicks (colored by ROAS)")
-            fig3.update_layout(xaxis_title="Total Spend ($)", yaxis_title="Total Clicks")
-            st.plotly_chart(fig3, use_container_width=True)
+            # Spend vs Clicks
+            st.plotly_chart(figures['spend_vs_clicks'], use_container_width=True)
         
         with col14:
             # Conversion Rate Analysis
-            total_clicks_calculated = filtered_data[['clicks_Facebook', 'clicks_Google', 'clicks_TikTok']].sum().sum()
-            conversion_rate = (filtered_data['# of orders'].sum() / total_clicks_calculated * 100) if total_clicks_calculated > 0 else 0
-            fig4 = px.pie(values=[conversion_rate, 100-conversion_rate], 
-                         names=['Converted', 'Not Converted'],
-                         title=f"Overall Conversion Rate: {conversion_rate:.2f}%",
-                         color_discrete_sequence=['#2ca02c', '#ff7f0e'])
-            st.plotly_chart(fig4, use_container_width=True)
+            st.plotly_chart(figures['conversion_rate'], use_container_width=True)
 
 def create_channel_performance(combined_df, daily_marketing):
     """Create Channel Performance dashboard"""
     st.markdown('<div class="main-header">📱 Channel Performance</div>', unsafe_allow_html=True)
     
-    # Channel comparison metrics
-    channels = ['Facebook', 'Google', 'TikTok']
-    
-    # Aggregate data by channel
-    channel_metrics = []
-    for channel in channels:
-        spend_col = f'spend_{channel}'
-        revenue_col = f'attributed revenue_{channel}'
-        roas_col = f'roas_{channel}'
-        ctr_col = f'ctr_{channel}'
-        cpc_col = f'cpc_{channel}'
-        
-        if spend_col in combined_df.columns:
-            total_spend = combined_df[spend_col].sum()
-            total_revenue = combined_df[revenue_col].sum()
-            avg_roas = combined_df[roas_col].mean() if roas_col in combined_df.columns else 0
-            avg_ctr = combined_df[ctr_col].mean() if ctr_col in combined_df.columns else 0
-            avg_cpc = combined_df[cpc_col].mean() if cpc_col in combined_df.columns else 0
-            
-            channel_metrics.append({
-                'Channel': channel,
-                'Total Spend': total_spend,
-                'Total Revenue': total_revenue,
-                'Average ROAS': avg_roas,
-                'Average CTR': avg_ctr,
-                'Average CPC': avg_cpc
-            })
+    # Date range selector
+    date_range = select_report_range(combined_df, "channel")
+    if date_range is None:
+        return
+    start_date, end_date = date_range
     
-    channel_df = pd.DataFrame(channel_metrics)
+    # Serve precomputed values for standard ranges, compute live otherwise
+    snapshot = find_snapshot(load_snapshots(), load_data_fingerprint(), "Channel Performance", start_date, end_date)
+    if snapshot is not None:
+        channel_df = pd.DataFrame(snapshot['channel_metrics'])
+        figures = figures_from_snapshot(snapshot)
+    else:
+        channel_df = compute_channel_metrics(combined_df, start_date, end_date)
+        figures = build_channel_figures(channel_df, daily_marketing, start_date, end_date) if not channel_df.empty else {}
     
     if not channel_df.empty:
         # Channel comparison charts
@@ -276,69 +247,40 @@ def create_channel_performance(combined_df, daily_marketing):
         
         with col1:
             # ROAS by Channel - Pie Chart
-            fig1 = px.pie(channel_df, values='Average ROAS', names='Channel',
-                         title="ROAS Distribution by Channel",
-                         color_discrete_sequence=px.colors.qualitative.Set3)
-            fig1.update_traces(textposition='inside', textinfo='percent+label')
-            st.plotly_chart(fig1, use_container_width=True)
+            st.plotly_chart(figures['roas_distribution'], use_container_width=True)
         
         with col2:
             # Spend vs Revenue by Channel
-            fig2 = px.scatter(channel_df, x='Total Spend', y='Total Revenue',
-                            size='Average ROAS', color='Channel',
-                            title="Spend vs Revenue by Channel")
-            st.plotly_chart(fig2, use_container_width=True)
+            st.plotly_chart(figures['spend_vs_revenue'], use_container_width=True)
         
         # Time series by channel
         st.markdown("## 📊 Channel Performance Over Time")
         
         # ROAS trends by channel
-        fig3 = px.line(daily_marketing, x='date', y='roas', color='channel',
-                      title="ROAS Trends by Channel")
-        fig3.update_layout(yaxis_title="ROAS")
-        st.plotly_chart(fig3, use_container_width=True)
+        st.plotly_chart(figures['roas_trend'], use_container_width=True)
         
         # CTR and CPC comparison
         col3, col4 = st.columns(2)
         
         with col3:
             # CTR by Channel - Bar Chart
-            fig_ctr = px.bar(channel_df, x='Channel', y='Average CTR',
-                           title="Average CTR by Channel",
-                           color='Average CTR',
-                           color_continuous_scale='Blues')
-            fig_ctr.update_layout(yaxis_title="CTR (%)")
-            st.plotly_chart(fig_ctr, use_container_width=True)
+            st.plotly_chart(figures['ctr_by_channel'], use_container_width=True)
         
         with col4:
             # CPC by Channel - Bar Chart
-            fig_cpc = px.bar(channel_df, x='Channel', y='Average CPC',
-                           title="Average CPC by Channel",
-                           color='Average CPC',
-                           color_continuous_scale='Reds')
-            fig_cpc.update_layout(yaxis_title="CPC ($)")
-            st.plotly_chart(fig_cpc, use_container_width=True)
+            st.plotly_chart(figures['cpc_by_channel'], use_container_width=True)
         
         # Spend trends by channel
-        fig4 = px.line(daily_marketing, x='date', y='spend', color='channel',
-                      title="Spend Trends by Channel")
-        fig4.update_layout(yaxis_title="Spend ($)")
-        st.plotly_chart(fig4, use_container_width=True)
+        st.plotly_chart(figures['spend_trend'], use_container_width=True)
         
         # CTR and CPC trends over time
         col5, col6 = st.columns(2)
         
         with col5:
-            fig_ctr_trend = px.line(daily_marketing, x='date', y='ctr', color='channel',
-                                   title="CTR Trends by Channel")
-            fig_ctr_trend.update_layout(yaxis_title="CTR (%)")
-            st.plotly_chart(fig_ctr_trend, use_container_width=True)
+            st.plotly_chart(figures['ctr_trend'], use_container_width=True)
         
         with col6:
-            fig_cpc_trend = px.line(daily_marketing, x='date', y='cpc', color='channel',
-                                   title="CPC Trends by Channel")
-            fig_cpc_trend.update_layout(yaxis_title="CPC ($)")
-            st.plotly_chart(fig_cpc_trend, use_container_width=True)
+            st.plotly_chart(figures['cpc_trend'], use_container_width=True)
         
         # Channel metrics table
         st.markdown("## 📋 Channel Performance Summary")
@@ -463,11 +405,74 @@ def create_campaign_analysis(marketing_df):
                                        options=marketing_df['state'].unique(),
                                        default=marketing_df['state'].unique())
     
+    # Date range selector
+    date_range = st.date_input(
+        "Select Date Range",
+        value=(marketing_df['date'].min().date(), marketing_df['date'].max().date()),
+        min_value=marketing_df['date'].min().date(),
+        max_value=marketing_df['date'].max().date(),
+        key="campaign_date_range"
+    )
+    if len(date_range) != 2:
+        return
+    start_date, end_date = date_range
+    
+    # Campaign leaderboard
+    st.markdown("## 🏆 Campaign Leaderboard")
+    
+    col4, col5, col6, col7 = st.columns(4)
+    
+    with col4:
+        metric = st.selectbox("Rank By", list(LEADERBOARD_METRICS), key="leaderboard_metric")
+    
+    with col5:
+        direction = st.radio("Show", ["Top", "Bottom"], horizontal=True, key="leaderboard_direction")
+    
+    with col6:
+        k = st.number_input("Number of Campaigns", min_value=1, max_value=100, value=10, key="leaderboard_k")
+    
+    with col7:
+        min_spend = st.number_input("Minimum Spend ($)", min_value=0.0, value=0.0, step=100.0,
+                                    key="leaderboard_min_spend")
+    
+    leaderboard_data = load_leaderboard_data()
+    if leaderboard_data is None:
+        st.warning("Campaign daily aggregates not found. Please re-run data_processing.py.")
+    else:
+        leaderboard = campaign_leaderboard(
+            leaderboard_data, metric, int(k), start_date, end_date,
+            selected_channels, selected_tactics, selected_states,
+            min_spend, best=(direction == "Top")
+        )
+        
+        if leaderboard.empty:
+            st.info("No campaigns match the selected filters and minimum spend.")
+            if min_spend == 0:
+                # No campaign spends under these filters, so skip the row-level detail below
+                return
+        else:
+            metric_col = LEADERBOARD_METRICS[metric][0]
+            
+            # Campaigns sharing a name across channel, tactic or state need distinct bars
+            repeated = leaderboard['campaign'].duplicated(keep=False)
+            leaderboard['label'] = leaderboard['campaign'].where(
+                ~repeated,
+                leaderboard['campaign'] + ' (' + leaderboard['tactic'] + ', ' + leaderboard['state'] + ')'
+            )
+            
+            fig1 = px.bar(leaderboard, x='label', y=metric_col, color='channel',
+                         title=f"{direction} {len(leaderboard)} Campaigns by {metric}")
+            fig1.update_layout(xaxis_title="Campaign", yaxis_title=metric,
+                               xaxis={'categoryorder': 'array', 'categoryarray': leaderboard['label']})
+            st.plotly_chart(fig1, use_container_width=True)
+    
     # Filter data
     filtered_marketing = marketing_df[
         (marketing_df['channel'].isin(selected_channels)) &
         (marketing_df['tactic'].isin(selected_tactics)) &
-        (marketing_df['state'].isin(selected_states))
+        (marketing_df['state'].isin(selected_states)) &
+        (marketing_df['date'].dt.date >= start_date) &
+        (marketing_df['date'].dt.date <= end_date)
     ]
     
     if not filtered_marketing.empty:
@@ -481,17 +486,6 @@ def create_campaign_analysis(marketing_df):
             'cpm': 'mean'
         }).reset_index()
         
-        campaign_performance = campaign_performance.sort_values('roas', ascending=False)
-        
-        # Top performing campaigns
-        st.markdown("## 🏆 Top Performing Campaigns by ROAS")
-        top_campaigns = campaign_performance.head(10)
-        
-        fig1 = px.bar(top_campaigns, x='campaign', y='roas', color='channel',
-                     title="Top 10 Campaigns by ROAS")
-        fig1.update_layout(xaxis_title="Campaign", yaxis_title="ROAS")
-        st.plotly_chart(fig1, use_container_width=True)
-        
         # Campaign efficiency scatter plot
         fig2 = px.scatter(campaign_performance, x='spend', y='attributed revenue',
                          size='roas', color='channel',
@@ -503,6 +497,78 @@ def create_campaign_analysis(marketing_df):
         st.markdown("## 📋 Campaign Performance Details")
         st.dataframe(campaign_performance.round(2), use_container_width=True)
 
+def create_scenario_planner(combined_df):
+    """Create What-If Scenario Planner dashboard"""
+    st.markdown('<div class="main-header">🧪 What-If Scenario Planner</div>', unsafe_allow_html=True)
+    
+    # Date range selector
+    date_range = st.date_input(
+        "Select Date Range",
+        value=(combined_df.index.min().date(), combined_df.index.max().date()),
+        min_value=combined_df.index.min().date(),
+        max_value=combined_df.index.max().date(),
+        key="scenario_date_range"
+    )
+    if len(date_range) != 2:
+        return
+    start_date, end_date = date_range
+    filtered_data = combined_df[(combined_df.index.date >= start_date) & (combined_df.index.date <= end_date)]
+    
+    # Multiplier grid inputs
+    st.markdown("## 🎛️ Scenario Multipliers")
+    st.markdown("Every combination of the selected multipliers is evaluated as a scenario.")
+    
+    levels = {}
+    for col, channel in zip(st.columns(len(CHANNELS)), CHANNELS):
+        with col:
+            st.markdown(f"**{channel}**")
+            for lever in LEVERS:
+                levels[(channel, lever)] = st.multiselect(
+                    f"{LEVER_LABELS[lever]} Multiplier",
+                    options=MULTIPLIER_OPTIONS,
+                    default=[1.0],
+                    format_func=lambda value: f"{value - 1:+.0%}",
+                    key=f"scenario_{channel}_{lever}"
+                ) or [1.0]
+    
+    n_scenarios = int(np.prod([len(values) for values in levels.values()]))
+    if n_scenarios > MAX_SCENARIOS:
+        st.warning(f"{n_scenarios:,} scenarios selected. Please narrow the grid to at most {MAX_SCENARIOS:,}.")
+        return
+    
+    multipliers = build_scenario_grid(levels)
+    summary = summarize_scenarios(run_scenarios(filtered_data, multipliers), multipliers)
+    
+    # Baseline comparison
+    baseline_spend = filtered_data['total_spend'].sum()
+    baseline_revenue = filtered_data['total_attributed_revenue'].sum()
+    summary['spend_change'] = summary['total_spend'] - baseline_spend
+    summary['revenue_change'] = summary['total_attributed_revenue'] - baseline_revenue
+    
+    st.markdown(f"## 📊 Scenario Comparison ({len(summary):,} scenarios)")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fig1 = px.scatter(summary, x='total_spend', y='total_attributed_revenue',
+                         color='total_roas', hover_name='scenario',
+                         title="Scenario Spend vs Attributed Revenue (colored by ROAS)")
+        fig1.update_layout(xaxis_title="Total Spend ($)", yaxis_title="Attributed Revenue ($)")
+        st.plotly_chart(fig1, use_container_width=True)
+    
+    with col2:
+        fig2 = px.scatter(summary, x='total_cac', y='total_roas',
+                         color='total_spend', hover_name='scenario',
+                         title="Scenario CAC vs ROAS (colored by Spend)")
+        fig2.update_layout(xaxis_title="CAC ($)", yaxis_title="ROAS")
+        st.plotly_chart(fig2, use_container_width=True)
+        st.caption("CAC assumes only the paid share of new customers (attributed ÷ total revenue per day) "
+                   "moves with attributed revenue; the remaining new customers are treated as organic.")
+    
+    # Scenario table
+    st.markdown("## 📋 Scenario Details")
+    st.dataframe(summary.round(2), use_container_width=True)
+
 def main():
     """Main dashboard application"""
     # Load data
@@ -518,7 +584,7 @@ def main():
     # Navigation
     page = st.sidebar.selectbox(
         "Select Dashboard View",
-        ["Executive Overview", "Channel Performance", "Customer Acquisition", "Campaign Analysis"]
+        ["Executive Overview", "Channel Performance", "Customer Acquisition", "Campaign Analysis", "Scenario Planner"]
     )
     
     # Data info
@@ -537,6 +603,8 @@ def main():
         create_customer_acquisition(combined_df)
     elif page == "Campaign Analysis":
         create_campaign_analysis(marketing_df)
+    elif page == "Scenario Planner":
+        create_scenario_planner(combined_df)
     
     # Footer
     st.markdown("---")
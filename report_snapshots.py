@@ -0,0 +1,313 @@
+import hashlib
+import json
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.subplots import make_subplots
+from datetime import timedelta
+from channels import CHANNELS
+
+SNAPSHOT_FILE = 'report_snapshots.json'
+SNAPSHOT_PAGES = ['Executive Overview', 'Channel Performance']
+
+def standard_date_ranges(combined_df):
+    """
+    Return the standard report ranges (name -> (start_date, end_date)),
+    anchored on the last date in the data and clipped to the first one
+    """
+    first_date = combined_df.index.min().date()
+    last_date = combined_df.index.max().date()
+    quarter_start_month = 3 * ((last_date.month - 1) // 3) + 1
+
+    ranges = {
+        'Full Period': first_date,
+        'Last 7 Days': last_date - timedelta(days=6),
+        'Last 30 Days': last_date - timedelta(days=29),
+        'Last 90 Days': last_date - timedelta(days=89),
+        'Month to Date': last_date.replace(day=1),
+        'Quarter to Date': last_date.replace(month=quarter_start_month, day=1),
+    }
+    return {name: (max(start, first_date), last_date) for name, start in ranges.items()}
+
+def filter_date_range(data, start_date, end_date):
+    """Filter a date-indexed frame to an inclusive date range"""
+    return data[(data.index.date >= start_date) & (data.index.date <= end_date)]
+
+def calculate_period_comparison(data, metric, current_period, previous_period):
+    """Calculate percentage change between periods"""
+    current_value = data[data.index.isin(current_period)][metric].sum()
+    previous_value = data[data.index.isin(previous_period)][metric].sum()
+
+    if previous_value == 0:
+        return 0
+    return ((current_value - previous_value) / previous_value) * 100
+
+def compute_executive_kpis(combined_df, start_date, end_date):
+    """
+    Calculate the Executive Overview KPI values for a date range
+    """
+    filtered_data = filter_date_range(combined_df, start_date, end_date)
+
+    # Previous period for comparison
+    period_length = (end_date - start_date).days
+    prev_start = start_date - timedelta(days=period_length)
+    prev_end = start_date - timedelta(days=1)
+    prev_data = filter_date_range(combined_df, prev_start, prev_end)
+
+    total_spend = filtered_data['total_spend'].sum()
+    total_impressions = filtered_data[[f'impressions_{channel}' for channel in CHANNELS]].sum().sum()
+    total_clicks = filtered_data[[f'clicks_{channel}' for channel in CHANNELS]].sum().sum()
+
+    kpis = {
+        'total_spend': total_spend,
+        'total_revenue': filtered_data['total revenue'].sum(),
+        'total_orders': filtered_data['# of orders'].sum(),
+        'avg_roas': filtered_data['total_roas'].mean(),
+        'gross_profit': filtered_data['gross profit'].sum(),
+        'avg_cac': filtered_data['total_cac'].mean(),
+        'new_customers': filtered_data['new customers'].sum(),
+        'avg_aov': filtered_data['aov'].mean(),
+        'total_impressions': total_impressions,
+        'total_clicks': total_clicks,
+        'overall_ctr': (total_clicks / total_impressions) if total_impressions > 0 else 0,
+        'overall_cpc': (total_spend / total_clicks) if total_clicks > 0 else 0,
+        'spend_change': calculate_period_comparison(combined_df, 'total_spend',
+                                                    filtered_data.index.date, prev_data.index.date),
+        'revenue_change': calculate_period_comparison(combined_df, 'total revenue',
+                                                      filtered_data.index.date, prev_data.index.date),
+        'orders_change': calculate_period_comparison(combined_df, '# of orders',
+                                                     filtered_data.index.date, prev_data.index.date),
+    }
+
+    # Cast numpy scalars so the values serialize to JSON
+    return {key: float(value) for key, value in kpis.items()}
+
+def build_executive_figures(combined_df, start_date, end_date):
+    """
+    Build the Executive Overview charts for a date range
+    """
+    filtered_data = filter_date_range(combined_df, start_date, end_date)
+
+    # Daily Spend vs Revenue
+    fig1 = make_subplots(specs=[[{"secondary_y": True}]])
+
+    fig1.add_trace(
+        go.Scatter(x=filtered_data.index, y=filtered_data['total_spend'],
+                  name="Daily Spend", line=dict(color='#ff7f0e')),
+        secondary_y=False,
+    )
+
+    fig1.add_trace(
+        go.Scatter(x=filtered_data.index, y=filtered_data['total revenue'],
+                  name="Daily Revenue", line=dict(color='#2ca02c')),
+        secondary_y=True,
+    )
+
+    fig1.update_xaxes(title_text="Date")
+    fig1.update_yaxes(title_text="Daily Spend ($)", secondary_y=False)
+    fig1.update_yaxes(title_text="Daily Revenue ($)", secondary_y=True)
+    fig1.update_layout(title_text="Daily Spend vs Daily Revenue", height=400)
+
+    # ROAS Trend
+    fig2 = px.line(filtered_data.reset_index(), x='date', y='total_roas',
+                  title="ROAS Trend Over Time", height=400)
+    fig2.update_layout(yaxis_title="ROAS")
+
+    # Spend vs Clicks
+    filtered_data_copy = filtered_data.copy()
+    filtered_data_copy['total_clicks'] = filtered_data_copy[[f'clicks_{channel}' for channel in CHANNELS]].sum(axis=1)
+
+    fig3 = px.scatter(filtered_data_copy.reset_index(), x='total_spend', y='total_clicks',
+                    color='total_roas', size='total revenue',
+                    title="Spend vs Clicks (colored by ROAS)")
+    fig3.update_layout(xaxis_title="Total Spend ($)", yaxis_title="Total Clicks")
+
+    # Conversion Rate Analysis
+    total_clicks_calculated = filtered_data_copy['total_clicks'].sum()
+    conversion_rate = (filtered_data['# of orders'].sum() / total_clicks_calculated * 100) if total_clicks_calculated > 0 else 0
+    fig4 = px.pie(values=[conversion_rate, 100-conversion_rate],
+                 names=['Converted', 'Not Converted'],
+                 title=f"Overall Conversion Rate: {conversion_rate:.2f}%",
+                 color_discrete_sequence=['#2ca02c', '#ff7f0e'])
+
+    return {
+        'spend_vs_revenue': fig1,
+        'roas_trend': fig2,
+        'spend_vs_clicks': fig3,
+        'conversion_rate': fig4,
+    }
+
+def compute_channel_metrics(combined_df, start_date, end_date):
+    """
+    Aggregate per-channel spend, revenue and efficiency metrics for a date range
+    """
+    filtered_data = filter_date_range(combined_df, start_date, end_date)
+
+    channel_metrics = []
+    for channel in CHANNELS:
+        spend_col = f'spend_{channel}'
+        revenue_col = f'attributed revenue_{channel}'
+        roas_col = f'roas_{channel}'
+        ctr_col = f'ctr_{channel}'
+        cpc_col = f'cpc_{channel}'
+
+        if spend_col in filtered_data.columns:
+            channel_metrics.append({
+                'Channel': channel,
+                'Total Spend': filtered_data[spend_col].sum(),
+                'Total Revenue': filtered_data[revenue_col].sum(),
+                'Average ROAS': filtered_data[roas_col].mean() if roas_col in filtered_data.columns else 0,
+                'Average CTR': filtered_data[ctr_col].mean() if ctr_col in filtered_data.columns else 0,
+                'Average CPC': filtered_data[cpc_col].mean() if cpc_col in filtered_data.columns else 0
+            })
+
+    return pd.DataFrame(channel_metrics)
+
+def build_channel_figures(channel_df, daily_marketing, start_date, end_date):
+    """
+    Build the Channel Performance charts for a date range
+    """
+    daily_marketing = daily_marketing[(daily_marketing['date'].dt.date >= start_date) &
+                                      (daily_marketing['date'].dt.date <= end_date)]
+
+    # ROAS by Channel - Pie Chart
+    fig1 = px.pie(channel_df, values='Average ROAS', names='Channel',
+                 title="ROAS Distribution by Channel",
+                 color_discrete_sequence=px.colors.qualitative.Set3)
+    fig1.update_traces(textposition='inside', textinfo='percent+label')
+
+    # Spend vs Revenue by Channel
+    fig2 = px.scatter(channel_df, x='Total Spend', y='Total Revenue',
+                    size='Average ROAS', color='Channel',
+                    title="Spend vs Revenue by Channel")
+
+    # ROAS trends by channel
+    fig3 = px.line(daily_marketing, x='date', y='roas', color='channel',
+                  title="ROAS Trends by Channel")
+    fig3.update_layout(yaxis_title="ROAS")
+
+    # CTR by Channel - Bar Chart
+    fig_ctr = px.bar(channel_df, x='Channel', y='Average CTR',
+                   title="Average CTR by Channel",
+                   color='Average CTR',
+                   color_continuous_scale='Blues')
+    fig_ctr.update_layout(yaxis_title="CTR (%)")
+
+    # CPC by Channel - Bar Chart
+    fig_cpc = px.bar(channel_df, x='Channel', y='Average CPC',
+                   title="Average CPC by Channel",
+                   color='Average CPC',
+                   color_continuous_scale='Reds')
+    fig_cpc.update_layout(yaxis_title="CPC ($)")
+
+    # Spend trends by channel
+    fig4 = px.line(daily_marketing, x='date', y='spend', color='channel',
+                  title="Spend Trends by Channel")
+    fig4.update_layout(yaxis_title="Spend ($)")
+
+    # CTR and CPC trends over time
+    fig_ctr_trend = px.line(daily_marketing, x='date', y='ctr', color='channel',
+                           title="CTR Trends by Channel")
+    fig_ctr_trend.update_layout(yaxis_title="CTR (%)")
+
+    fig_cpc_trend = px.line(daily_marketing, x='date', y='cpc', color='channel',
+                           title="CPC Trends by Channel")
+    fig_cpc_trend.update_layout(yaxis_title="CPC ($)")
+
+    return {
+        'roas_distribution': fig1,
+        'spend_vs_revenue': fig2,
+        'roas_trend': fig3,
+        'ctr_by_channel': fig_ctr,
+        'cpc_by_channel': fig_cpc,
+        'spend_trend': fig4,
+        'ctr_trend': fig_ctr_trend,
+        'cpc_trend': fig_cpc_trend,
+    }
+
+def data_fingerprint(combined_df, daily_marketing):
+    """
+    Checksum of the processed data: shapes, columns, date span and rounded
+    column sums, which survive the CSV round trip between pipeline and dashboard
+    """
+    parts = []
+    for df in [combined_df, daily_marketing]:
+        numeric = df.select_dtypes('number')
+        parts.append({
+            'shape': list(df.shape),
+            'columns': [str(col) for col in df.columns],
+            'sums': [round(float(value), 4) for value in numeric.sum()],
+        })
+    parts.append([combined_df.index.min().strftime('%Y-%m-%d'), combined_df.index.max().strftime('%Y-%m-%d')])
+    return hashlib.sha256(json.dumps(parts).encode()).hexdigest()
+
+def create_report_snapshots(combined_df, daily_marketing):
+    """
+    Precompute KPI values and serialized figure specs for the standard
+    date ranges of the Executive Overview and Channel Performance pages
+    """
+    print("Creating report snapshots...")
+
+    snapshots = {
+        'data_start': combined_df.index.min().strftime('%Y-%m-%d'),
+        'data_end': combined_df.index.max().strftime('%Y-%m-%d'),
+        'fingerprint': data_fingerprint(combined_df, daily_marketing),
+        'ranges': {},
+    }
+
+    for name, (start_date, end_date) in standard_date_ranges(combined_df).items():
+        channel_df = compute_channel_metrics(combined_df, start_date, end_date)
+        executive_figures = build_executive_figures(combined_df, start_date, end_date)
+        channel_figures = build_channel_figures(channel_df, daily_marketing, start_date, end_date)
+
+        snapshots['ranges'][name] = {
+            'start_date': start_date.isoformat(),
+            'end_date': end_date.isoformat(),
+            'Executive Overview': {
+                'kpis': compute_executive_kpis(combined_df, start_date, end_date),
+                'figures': {key: fig.to_json() for key, fig in executive_figures.items()},
+            },
+            'Channel Performance': {
+                'channel_metrics': channel_df.to_dict(orient='records'),
+                'figures': {key: fig.to_json() for key, fig in channel_figures.items()},
+            },
+        }
+
+    print(f"Created snapshots for {len(snapshots['ranges'])} date ranges")
+    return snapshots
+
+def save_report_snapshots(snapshots, path=SNAPSHOT_FILE):
+    """Write report snapshots to disk"""
+    with open(path, 'w') as f:
+        json.dump(snapshots, f)
+
+def load_report_snapshots(path=SNAPSHOT_FILE):
+    """Read report snapshots from disk, returning None if they are missing"""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+def find_snapshot(snapshots, fingerprint, page, start_date, end_date):
+    """
+    Return the snapshot for a page and date range, or None if there is no
+    match or the snapshots were built from different data
+    """
+    if not snapshots or page not in SNAPSHOT_PAGES:
+        return None
+
+    # Snapshots from a previous data load are stale
+    if snapshots.get('fingerprint') != fingerprint:
+        return None
+
+    for snapshot in snapshots['ranges'].values():
+        if (snapshot['start_date'] == start_date.isoformat() and
+                snapshot['end_date'] == end_date.isoformat()):
+            return snapshot[page]
+    return None
+
+def figures_from_snapshot(snapshot):
+    """Deserialize the figure specs stored in a page snapshot"""
+    return {key: pio.from_json(spec) for key, spec in snapshot['figures'].items()}
@@ -0,0 +1,104 @@
+import pandas as pd
+import numpy as np
+from channels import CHANNELS
+
+LEVERS = ['spend', 'cpc', 'conversion']
+LEVER_LABELS = {'spend': 'Spend', 'cpc': 'CPC', 'conversion': 'Conversion'}
+MULTIPLIER_OPTIONS = [0.5, 0.7, 0.8, 0.9, 1.0, 1.1, 1.2, 1.3, 1.5, 2.0]
+MAX_SCENARIOS = 5000
+
+def build_scenario_grid(levels):
+    """
+    Expand per-channel lever multipliers into the full scenario grid.
+
+    levels maps (channel, lever) to a list of multipliers; missing entries stay
+    at 1.0. Returns an array of shape (scenarios, channels, levers).
+    """
+    axes = [np.asarray(levels.get((channel, lever), [1.0]), dtype=float)
+            for channel in CHANNELS for lever in LEVERS]
+    grid = np.stack(np.meshgrid(*axes, indexing='ij'), axis=-1)
+    return grid.reshape(-1, len(CHANNELS), len(LEVERS))
+
+def scenario_labels(multipliers):
+    """Readable description of each scenario's non-baseline levers"""
+    changed = ~np.isclose(multipliers, 1.0)
+    labels = []
+    for scenario, scenario_changed in zip(multipliers.tolist(), changed.tolist()):
+        changes = [f"{channel} {LEVER_LABELS[lever]} {scenario[c][l] - 1:+.0%}"
+                   for c, channel in enumerate(CHANNELS)
+                   for l, lever in enumerate(LEVERS)
+                   if scenario_changed[c][l]]
+        labels.append(", ".join(changes) if changes else "Baseline")
+    return labels
+
+def run_scenarios(combined_df, multipliers):
+    """
+    Recompute the combined dataset's spend, revenue, ROAS and CAC columns for
+    every scenario at once.
+
+    Spend multipliers scale spend. Clicks follow spend / CPC, and attributed
+    revenue scales with clicks and the conversion multiplier. Only the paid
+    share of each day's new customers (attributed / total revenue) scales
+    with attributed revenue; the rest are treated as organic. All arrays
+    broadcast over (scenarios, days, channels).
+    """
+    spend = combined_df[[f'spend_{channel}' for channel in CHANNELS]].to_numpy(dtype=float)
+    revenue = combined_df[[f'attributed revenue_{channel}' for channel in CHANNELS]].to_numpy(dtype=float)
+    new_customers = combined_df['new customers'].to_numpy(dtype=float)
+    total_revenue = combined_df['total revenue'].to_numpy(dtype=float)
+
+    spend_mult = multipliers[:, None, :, 0]
+    cpc_mult = multipliers[:, None, :, 1]
+    conversion_mult = multipliers[:, None, :, 2]
+
+    scenario_spend = spend * spend_mult
+    scenario_revenue = revenue * (spend_mult / cpc_mult) * conversion_mult
+
+    total_spend = scenario_spend.sum(axis=2)
+    total_attributed_revenue = scenario_revenue.sum(axis=2)
+
+    baseline_revenue = revenue.sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        revenue_ratio = np.where(baseline_revenue > 0, total_attributed_revenue / baseline_revenue, 1)
+        paid_share = np.clip(np.where(total_revenue > 0, baseline_revenue / total_revenue, 0), 0, 1)
+        scenario_new_customers = new_customers * (1 + paid_share * (revenue_ratio - 1))
+
+        total_roas = np.where(total_spend > 0, total_attributed_revenue / total_spend, 0)
+        total_cac = np.where(scenario_new_customers > 0, total_spend / scenario_new_customers, 0)
+        channel_cac = np.where(scenario_new_customers[:, :, None] > 0,
+                               scenario_spend / scenario_new_customers[:, :, None], 0)
+
+    results = {
+        'spend': scenario_spend,
+        'attributed revenue': scenario_revenue,
+        'new customers': scenario_new_customers,
+        'total_spend': total_spend,
+        'total_attributed_revenue': total_attributed_revenue,
+        'total_roas': total_roas,
+        'total_cac': total_cac,
+    }
+    for c, channel in enumerate(CHANNELS):
+        results[f'cac_{channel}'] = channel_cac[:, :, c]
+    return results
+
+def summarize_scenarios(results, multipliers):
+    """
+    Period totals per scenario, with ROAS and CAC taken as ratios of the totals
+    """
+    total_spend = results['total_spend'].sum(axis=1)
+    total_revenue = results['total_attributed_revenue'].sum(axis=1)
+    new_customers = results['new customers'].sum(axis=1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        summary = pd.DataFrame({
+            'scenario': scenario_labels(multipliers),
+            'total_spend': total_spend,
+            'total_attributed_revenue': total_revenue,
+            'total_roas': np.where(total_spend > 0, total_revenue / total_spend, 0),
+            'new customers': new_customers,
+            'total_cac': np.where(new_customers > 0, total_spend / new_customers, 0),
+        })
+        channel_spend = results['spend'].sum(axis=1)
+        for c, channel in enumerate(CHANNELS):
+            summary[f'cac_{channel}'] = np.where(new_customers > 0, channel_spend[:, c] / new_customers, 0)
+    return summary